@@ -17,6 +17,14 @@ ALLOWED_HOSTS = (
     else ['localhost', '127.0.0.1', '0.0.0.0', 'backend']
 )
 
+# Connection URLs — read once; config() re-walks its repository per call.
+REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
+DATABASE_URL = config('DATABASE_URL')
+
+# Minimal mode skips third-party apps whose configs are expensive to
+# import; meant for CI management commands (collectstatic, makemigrations).
+DJANGO_MINIMAL = config('DJANGO_MINIMAL', default=False, cast=bool)
+
 # Applications
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -25,15 +33,20 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'rest_framework',
-    'corsheaders',
-    'django_filters',
+    'django.contrib.postgres',
+]
+if not DJANGO_MINIMAL:
+    INSTALLED_APPS += [
+        'rest_framework',
+        'corsheaders',
+        'django_filters',
+    ]
+INSTALLED_APPS += [
     'projects',
 ]
 
 # Middleware
-MIDDLEWARE = [
-    'corsheaders.middleware.CorsMiddleware',
+MIDDLEWARE = ([] if DJANGO_MINIMAL else ['corsheaders.middleware.CorsMiddleware']) + [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
@@ -68,7 +81,7 @@ TEMPLATES = [
 # Database
 DATABASES = {
     'default': dj_database_url.config(
-        default=config('DATABASE_URL'),
+        default=DATABASE_URL,
         conn_max_age=600,
         conn_health_checks=True,
     )
@@ -78,8 +91,16 @@ DATABASES = {
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': config('REDIS_URL', default='redis://localhost:6379/1'),
-        'OPTIONS': {'CLIENT_CLASS': 'django_redis.client.DefaultClient'},
+        'LOCATION': REDIS_URL,
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # Bounded pool shared per process instead of ad-hoc connections.
+            'CONNECTION_POOL_KWARGS': {'max_connections': 64},
+            # msgpack + zstd: faster than pickle for the small stats dicts
+            # we cache, and ~3x fewer bytes stored in Redis.
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
+            'COMPRESSOR': 'django_redis.compressors.zstd.ZstdCompressor',
+        },
     }
 }
 
@@ -119,7 +140,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # DRF
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'projects.pagination.ProjectCursorPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -139,7 +160,7 @@ if DEBUG:
     CORS_ALLOW_ALL_ORIGINS = True
 
 # Celery
-CELERY_BROKER_URL = config('REDIS_URL', default='redis://localhost:6379/0')
+CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
@@ -149,3 +170,5 @@ CELERY_ENABLE_UTC = True
 
 # Linguist
 LINGUIST_DOCKER_IMAGE = config('LINGUIST_DOCKER_IMAGE', default='project_viewer_linguist')
+LINGUIST_WRAPPER_DIR = BASE_DIR.parent / 'infra' / 'github-linguist'
+LINGUIST_TMPDIR = config('LINGUIST_TMPDIR', default='/dev/shm')
@@ -1,9 +1,12 @@
 """Django admin configuration for the Projects application."""
 
+from celery import group
 from django.contrib import admin
+from django.core.paginator import Paginator
 from django.db.models import Count
 from django.utils.html import format_html
 
+from .tasks import analyze_project
 from .models import (
     Client,
     Developer,
@@ -13,6 +16,57 @@ from .models import (
     ProjectAnalysis,
 )
 
+# ---------------------------------------------------------------------------
+# Page-scoped annotations
+# ---------------------------------------------------------------------------
+
+
+class AnnotatedPaginator(Paginator):
+    """Paginator applying queryset annotations to the visible page only.
+
+    Annotating in ``ModelAdmin.get_queryset`` makes the changelist count
+    and sort the grouped query over the whole table even though just one
+    page is rendered. Subclasses declare ``annotations``; the aggregates
+    are computed with a single extra query for the page's objects.
+    """
+
+    annotations = {}
+
+    def page(self, number):
+        page = super().page(number)
+        objects = list(page.object_list)
+        if self.annotations and objects:
+            rows = (
+                self.object_list.model._default_manager
+                .filter(pk__in=[obj.pk for obj in objects])
+                .annotate(**self.annotations)
+                .values('pk', *self.annotations)
+            )
+            by_pk = {row['pk']: row for row in rows}
+            for obj in objects:
+                # A row deleted between the two queries simply keeps no
+                # annotation; the column accessors fall back per object.
+                row = by_pk.get(obj.pk)
+                if row is not None:
+                    for name in self.annotations:
+                        setattr(obj, name, row[name])
+        page.object_list = objects
+        return page
+
+
+class ProjectsCountPaginator(AnnotatedPaginator):
+    annotations = {'_projects_cnt': Count('projects')}
+
+
+class StatusProjectsCountPaginator(AnnotatedPaginator):
+    # Project.status has no related_name, so the reverse is 'project'.
+    annotations = {'_projects_cnt': Count('project')}
+
+
+class LanguageUsagePaginator(AnnotatedPaginator):
+    annotations = {'_usage_cnt': Count('projectanalysis')}
+
+
 # ---------------------------------------------------------------------------
 # Client admin
 # ---------------------------------------------------------------------------
@@ -56,14 +110,13 @@ class ClientAdmin(admin.ModelAdmin):
         ),
     )
 
-    # Optimize COUNT(*) for related projects
-    def get_queryset(self, request):  # noqa: D401,D404  (admin override)
-        qs = super().get_queryset(request)
-        return qs.annotate(_projects_cnt=Count('projects'))
+    # COUNT(*) for related projects is attached per page by the paginator.
+    paginator = ProjectsCountPaginator
 
     def projects_count(self, obj):
-        """Return cached annotation added in `get_queryset`."""
-        return obj._projects_cnt
+        """Return the annotation attached by `ProjectsCountPaginator`."""
+        cnt = getattr(obj, '_projects_cnt', None)
+        return obj.projects.count() if cnt is None else cnt
 
     projects_count.short_description = 'Projects'
 
@@ -114,12 +167,11 @@ class DeveloperAdmin(admin.ModelAdmin):
         ),
     )
 
-    def get_queryset(self, request):  # noqa: D401,D404  (admin override)
-        qs = super().get_queryset(request)
-        return qs.annotate(_projects_cnt=Count('projects'))
+    paginator = ProjectsCountPaginator
 
     def projects_count(self, obj):
-        return obj._projects_cnt
+        cnt = getattr(obj, '_projects_cnt', None)
+        return obj.projects.count() if cnt is None else cnt
 
     projects_count.short_description = 'Projects'
 
@@ -138,9 +190,7 @@ class ProjectStatusAdmin(admin.ModelAdmin):
     ordering = ['order', 'name']
     search_fields = ['name']
 
-    def get_queryset(self, request):  # noqa: D401,D404  (admin override)
-        qs = super().get_queryset(request)
-        return qs.annotate(_projects_cnt=Count('projects'))
+    paginator = StatusProjectsCountPaginator
 
     def color_preview(self, obj):
         """Render small square with the status color."""
@@ -153,7 +203,8 @@ class ProjectStatusAdmin(admin.ModelAdmin):
     color_preview.short_description = 'Color'
 
     def projects_count(self, obj):
-        return obj._projects_cnt
+        cnt = getattr(obj, '_projects_cnt', None)
+        return obj.project_set.count() if cnt is None else cnt
 
     projects_count.short_description = 'Projects'
 
@@ -170,9 +221,7 @@ class LanguageAdmin(admin.ModelAdmin):
     list_display = ['name', 'color_preview', 'icon_preview', 'usage_count']
     search_fields = ['name']
 
-    def get_queryset(self, request):  # noqa: D401,D404  (admin override)
-        qs = super().get_queryset(request)
-        return qs.annotate(_usage_cnt=Count('analysis'))
+    paginator = LanguageUsagePaginator
 
     def color_preview(self, obj):
         return format_html(
@@ -192,7 +241,8 @@ class LanguageAdmin(admin.ModelAdmin):
     icon_preview.short_description = 'Icon'
 
     def usage_count(self, obj):
-        return obj._usage_cnt
+        cnt = getattr(obj, '_usage_cnt', None)
+        return obj.projectanalysis_set.count() if cnt is None else cnt
 
     usage_count.short_description = 'Used in'
 
@@ -209,6 +259,10 @@ class ProjectAnalysisInline(admin.TabularInline):
     extra = 0
     readonly_fields = ['language', 'lines_count', 'percentage']
 
+    def get_queryset(self, request):  # noqa: D401,D404  (admin override)
+        # Rows render language names; fetch them in the same query.
+        return super().get_queryset(request).select_related('language')
+
     def has_add_permission(self, request, obj=None):  # noqa: D401,D404
         return False  # Records are created automatically.
 
@@ -309,15 +363,18 @@ class ProjectAdmin(admin.ModelAdmin):
     make_private.short_description = 'Mark as private'
 
     def analyze_code(self, request, queryset):
-        """Trigger asynchronous code analysis via Celery / RQ."""
-        started = 0
-        for project in queryset:
-            if project.archive and hasattr(project, 'run_analysis_async'):
-                project.run_analysis_async()
-                started += 1
-
-        if started:
-            self.message_user(request, f'Analysis started for {started} project(s).')
+        """Trigger asynchronous code analysis via Celery."""
+        pks = list(
+            queryset
+            .exclude(archive='')
+            .exclude(archive__isnull=True)
+            .values_list('id', flat=True)
+        )
+
+        if pks:
+            # One broker round-trip for the whole selection.
+            group(analyze_project.s(str(pk)) for pk in pks).apply_async()
+            self.message_user(request, f'Analysis started for {len(pks)} project(s).')
         else:
             self.message_user(request, 'No archives found in selected projects.', level='WARNING')
 
@@ -337,6 +394,7 @@ class ProjectAnalysisAdmin(admin.ModelAdmin):
     list_filter = ['language', 'project__status']
     search_fields = ['project__name', 'language__name']
     readonly_fields = ['project', 'language', 'lines_count', 'percentage']
+    list_select_related = ('project', 'project__status', 'language')
 
     def has_add_permission(self, request):
         return False  # Records are created automatically.
@@ -0,0 +1,39 @@
+import re
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_alter_language_color_alter_projectstatus_color'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='client',
+            name='phone',
+            field=models.CharField(blank=True, max_length=20, validators=[django.core.validators.RegexValidator(message='Введите корректный номер телефона в международном формате.', regex=re.compile('^\\+?\\d{7,15}\\Z', re.ASCII))], verbose_name='Телефон'),
+        ),
+        migrations.AlterField(
+            model_name='developer',
+            name='phone',
+            field=models.CharField(blank=True, max_length=20, validators=[django.core.validators.RegexValidator(message='Введите корректный номер телефона в международном формате.', regex=re.compile('^\\+?\\d{7,15}\\Z', re.ASCII))], verbose_name='Телефон'),
+        ),
+        migrations.AlterField(
+            model_name='developer',
+            name='github_username',
+            field=models.CharField(blank=True, max_length=39, validators=[django.core.validators.RegexValidator(message='Некорректный GitHub-логин.', regex=re.compile('^[A-Za-z0-9-]{1,39}\\Z', re.ASCII))], verbose_name='GitHub'),
+        ),
+        migrations.AlterField(
+            model_name='language',
+            name='color',
+            field=models.CharField(default='#808080', max_length=7, validators=[django.core.validators.RegexValidator(message='Введите цвет в формате HEX, например "#FFAA00".', regex=re.compile('^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\\Z', re.ASCII))], verbose_name='Цвет (HEX)'),
+        ),
+        migrations.AlterField(
+            model_name='projectstatus',
+            name='color',
+            field=models.CharField(default='#808080', max_length=7, validators=[django.core.validators.RegexValidator(message='Введите цвет в формате HEX, например "#FFAA00".', regex=re.compile('^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\\Z', re.ASCII))], verbose_name='Цвет (HEX)'),
+        ),
+    ]
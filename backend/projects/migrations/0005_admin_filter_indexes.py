@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_project_created_id_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_pr_status__932d20_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', '-created_at'], name='proj_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['client', '-created_at'], name='proj_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['developer', '-created_at'], name='proj_dev_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_public', True)), fields=['-created_at'], name='proj_public_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectanalysis',
+            index=models.Index(fields=['project', '-percentage'], name='pa_project_pct_idx'),
+        ),
+    ]
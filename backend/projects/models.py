@@ -1,24 +1,31 @@
 import os
+import re
+import threading
+import time
 import uuid
+from functools import lru_cache
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import FileExtensionValidator, RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
-# Validators
+# Validators — patterns are pure ASCII and precompiled at import time,
+# so no request pays the deferred re.compile (re.ASCII skips the Unicode
+# tables, \Z avoids the $ newline-anchor special case).
 phone_validator = RegexValidator(
-    regex=r'^\+?\d{7,15}$',
+    regex=re.compile(r'^\+?\d{7,15}\Z', re.ASCII),
     message='Введите корректный номер телефона в международном формате.',
 )
 
 hex_color_validator = RegexValidator(
-    regex=r'^#(?:[0-9a-fA-F]{3}){1,2}$',
+    regex=re.compile(r'^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\Z', re.ASCII),
     message='Введите цвет в формате HEX, например "#FFAA00".',
 )
 
 github_validator = RegexValidator(
-    regex=r'^[A-Za-z0-9-]{1,39}$',
+    regex=re.compile(r'^[A-Za-z0-9-]{1,39}\Z', re.ASCII),
     message='Некорректный GitHub-логин.',
 )
 
@@ -157,13 +164,50 @@ class Language(models.Model):
         return self.name
 
 
+# Language lookup cache -------------------------------------------------------
+# The Language table is small and effectively append-only, so the analysis
+# write path keeps a per-process name -> pk map instead of querying per row.
+_LANGUAGE_CACHE_TTL = 300  # seconds
+_language_ids: dict = {}
+_language_ids_expire = 0.0
+_language_lock = threading.Lock()
+
+
+def language_ids(names) -> dict:
+    """Map language names to primary keys via a worker-level cache.
+
+    The whole table is (re)loaded at most every ``_LANGUAGE_CACHE_TTL``
+    seconds; names still unknown after a lookup are created on the spot
+    and cached immediately.
+    """
+    global _language_ids_expire
+    with _language_lock:
+        if time.monotonic() >= _language_ids_expire:
+            _language_ids.clear()
+            _language_ids.update(Language.objects.values_list('name', 'pk'))
+            _language_ids_expire = time.monotonic() + _LANGUAGE_CACHE_TTL
+
+        for name in names:
+            if name not in _language_ids:
+                language, _ = Language.objects.get_or_create(name=name)
+                _language_ids[name] = language.pk
+
+        return {name: _language_ids[name] for name in names}
+
+
 # Helper to build archive path ------------------------------------------------
 
+@lru_cache(maxsize=64)
+def _archive_ext(filename: str) -> str:
+    """Cached, normalized extension of an uploaded archive name."""
+    return os.path.splitext(filename)[1].lower() or '.zip'
+
+
 def project_archive_path(instance: 'Project', filename: str) -> str:
     """Return path like project_archives/<YEAR>/<MONTH>/<uuid>.zip."""
-    ext = os.path.splitext(filename)[1] or '.zip'
-    now = timezone.now()
-    return f'project_archives/{now:%Y/%m}/{instance.id}{ext}'
+    return 'project_archives/{}/{}{}'.format(
+        timezone.now().strftime('%Y/%m'), instance.id, _archive_ext(filename)
+    )
 
 
 # Project ---------------------------------------------------------------------
@@ -260,7 +304,23 @@ class Project(models.Model):
         verbose_name_plural = 'Проекты'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['status']),
+            # Keyset scan for cursor pagination ordered by (-created_at, id).
+            models.Index(fields=['-created_at', 'id'], name='proj_created_id_idx'),
+            # Admin list filters combined with the default -created_at sort;
+            # the status prefix also serves plain status lookups.
+            models.Index(fields=['status', '-created_at'], name='proj_status_created_idx'),
+            models.Index(fields=['client', '-created_at'], name='proj_client_created_idx'),
+            models.Index(fields=['developer', '-created_at'], name='proj_dev_created_idx'),
+            # Public feed: partial index keeps it small and sorted.
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(is_public=True),
+                name='proj_public_created_idx',
+            ),
+            # pg_trgm indexes back the admin icontains search over
+            # name/description with index probes instead of seq-scans.
+            GinIndex(fields=['name'], name='proj_name_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['description'], name='proj_desc_trgm', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self) -> str:
@@ -302,7 +362,38 @@ class ProjectAnalysis(models.Model):
                 name='percentage_0_100',
             ),
         ]
+        indexes = [
+            # Serves the default per-project ordering by -percentage.
+            models.Index(fields=['project', '-percentage'], name='pa_project_pct_idx'),
+        ]
         ordering = ['-percentage']
 
     def __str__(self) -> str:
         return f'{self.project.name} — {self.language.name}: {self.percentage}%'
+
+    @classmethod
+    def replace_for_project(cls, project: Project, stats: dict) -> int:
+        """Replace the project's analysis rows from linguist stats in bulk.
+
+        ``stats`` is the ``LinguistWrapper.analyze_zip`` mapping of
+        language name to ``{'percent': ..., 'lines': ...}``. Languages are
+        resolved through the worker-level ``language_ids`` cache and rows
+        are rewritten with a delete + ``bulk_create`` pair instead of a
+        round-trip per language; stale rows for languages gone from the
+        archive disappear as well.
+        """
+        ids = language_ids(list(stats))
+
+        rows = [
+            cls(
+                project=project,
+                language_id=ids[name],
+                lines_count=info['lines'],
+                percentage=info['percent'],
+            )
+            for name, info in stats.items()
+        ]
+        with transaction.atomic():
+            cls.objects.filter(project=project).delete()
+            cls.objects.bulk_create(rows)
+        return len(rows)
@@ -0,0 +1,16 @@
+"""DRF pagination classes for the Projects application."""
+
+from rest_framework.pagination import CursorPagination
+
+
+class ProjectCursorPagination(CursorPagination):
+    """Keyset pagination over the project feed.
+
+    PageNumberPagination runs COUNT(*) plus OFFSET N on every request,
+    so deep pages degrade to O(N). Cursor pagination turns each page
+    into a WHERE created_at < :last ... LIMIT range scan backed by the
+    (created_at, id) index; ``id`` breaks ties between projects created
+    in the same instant.
+    """
+
+    ordering = ('-created_at', 'id')
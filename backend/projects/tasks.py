@@ -0,0 +1,42 @@
+"""Celery tasks for the Projects application."""
+
+import sys
+from functools import lru_cache
+
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+
+
+@lru_cache(maxsize=1)
+def _get_wrapper():
+    """Build (once per process) a LinguistWrapper from the infra sidecar.
+
+    The wrapper owns the warm linguist container, so it must be reused
+    across task invocations — a fresh instance per task would start and
+    leak one container per analysis.
+    """
+    wrapper_dir = str(settings.LINGUIST_WRAPPER_DIR)
+    if wrapper_dir not in sys.path:
+        sys.path.append(wrapper_dir)
+    from linguist_wrapper import LinguistWrapper
+
+    return LinguistWrapper(
+        use_docker=True,
+        docker_image=settings.LINGUIST_DOCKER_IMAGE,
+        cache=cache,
+        tmp_dir=settings.LINGUIST_TMPDIR,
+    )
+
+
+@shared_task
+def analyze_project(project_id: str) -> int:
+    """Run linguist on the project archive and store per-language rows."""
+    from .models import Project, ProjectAnalysis
+
+    project = Project.objects.get(pk=project_id)
+    if not project.archive:
+        return 0
+
+    stats = _get_wrapper().analyze_zip(project.archive.path)
+    return ProjectAnalysis.replace_for_project(project, stats)
@@ -22,6 +22,11 @@ def parse_arguments():
         action="store_true",
         help="Use Docker image instead of local linguist gem"
     )
+    parser.add_argument(
+        "--lines",
+        action="store_true",
+        help="Re-read source files for exact line counts (slower)"
+    )
     parser.add_argument(
         "archive",
         help="Path to ZIP archive containing project"
@@ -35,7 +40,7 @@ def main():
     zip_path = Path(args.archive).expanduser().resolve()
 
     wrapper = LinguistWrapper(use_docker=args.docker)
-    stats = wrapper.analyze_zip(zip_path)
+    stats = wrapper.analyze_zip(zip_path, include_lines=args.lines)
 
     print(json.dumps(stats, ensure_ascii=False, indent=2))
 